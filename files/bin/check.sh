@@ -9,11 +9,26 @@ check_config() {
     knotc -c $1 conf-check
 }
 
+check_zone() {
+    # Buffer output so that parallel checks do not interleave in the log
+    local output status=0
+    output=$(kzonecheck "$1" 2>&1) || status=$?
+    printf '== %s\n' "$1"
+    if [ -n "$output" ]; then
+        printf '%s\n' "$output"
+    fi
+    return $status
+}
+
 check_zones() {
     shopt -s nullglob
-    for zone in $1/*.zone; do
-        kzonecheck $zone
-    done
+    local zones=("$1"/*.zone)
+    if [ "${#zones[@]}" -gt 0 ]; then
+        # Zones are independent of each other: check them in parallel
+        export -f check_zone
+        printf '%s\0' "${zones[@]}" \
+            | xargs -0 -n 1 -P "$(nproc)" bash -c 'check_zone "$1"' check_zone
+    fi
 }
 
 CONFIG_DIRS=""
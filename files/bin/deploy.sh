@@ -72,7 +72,9 @@ fi
 
 for file in $(rsync $RSYNCPARAMS $ZONES_DIR/ "$DEST":/config/zones/); do
     case $file in
-        *.zone) updated_zones="$updated_zones $(basename $file .zone)" ;;
+        *.zone)
+            zone=${file##*/}
+            updated_zones="$updated_zones ${zone%.zone}" ;;
     esac
 done
 if [ -n "$updated_zones" ]; then
@@ -85,17 +87,22 @@ fi
 
 set +x
 
+# Reload and status are sent as a single remote command, so that only one
+# ssh session is needed.
+
+remote_cmd="knotc zone-status"
+
 if [ -n "$updated_config" ]; then
     # Reload server configuration and all zones
 
-    ssh "$DEST" "knotc reload"
+    remote_cmd="knotc reload && $remote_cmd"
 
 elif [ -n "$updated_zones" ]; then
     # Reload updated zones
 
-    ssh "$DEST" "knotc zone-reload $updated_zones"
+    remote_cmd="knotc zone-reload $updated_zones && $remote_cmd"
 fi
 
-# Show status
+# Run reload (if any) and show status
 
-ssh "$DEST" "knotc zone-status"
+ssh "$DEST" "$remote_cmd"